@@ -0,0 +1,27 @@
+"""
+Corpus word counting shared by the OCR error finder and enchant_corrector.
+"""
+
+from itertools import islice
+
+# Pages joined per findall call when counting words
+BATCH_PAGES = 1000
+
+
+def count_words(pages, word_re, counts):
+    """
+    Add every word_re match in the markdown of pages (any iterable) to the
+    Counter counts, and return the number of pages.
+
+    Pages are joined in batches so one findall/update covers many pages;
+    the newline separator keeps words from running across pages.
+    """
+    page_count = 0
+    pages = iter(pages)
+    while True:
+        batch = list(islice(pages, BATCH_PAGES))
+        if not batch:
+            return page_count
+        page_count += len(batch)
+        text = '\n'.join(page.get('markdown', '') for page in batch)
+        counts.update(word_re.findall(text))
@@ -0,0 +1,71 @@
+"""
+Page correction shared by the pattern-based correctors.
+
+Works with any corrector that has correct_text(text[, threshold]), a
+corrections_made Counter, and add_corrections(counter) to merge counts
+made elsewhere. Without a threshold, correct_text's own default applies.
+"""
+
+from collections import Counter
+from multiprocessing import Pool
+
+# Pages per worker task in correct_pages
+CHUNK_PAGES = 50
+
+# Per-process corrector and threshold for the correct_pages workers
+_worker_corrector = None
+_worker_threshold = None
+
+
+def correct_page(corrector, page, threshold=None):
+    """Correct a page's markdown in place; a page without markdown (missing or None) is left as it is."""
+    markdown = page.get('markdown')
+    if markdown is not None:
+        if threshold is None:
+            page['markdown'] = corrector.correct_text(markdown)
+        else:
+            page['markdown'] = corrector.correct_text(markdown, threshold)
+    return page
+
+
+def correct_pages(corrector, pages, workers, progress, threshold=None):
+    """
+    Correct every page of the list pages with correct_page, at threshold
+    if given.
+
+    With workers > 1 the pages are corrected in fixed-size chunks in
+    worker processes (each holding a copy of corrector), put back in page
+    order, and their corrections_made merged through add_corrections.
+    progress(i) is called with the number of pages done every 100 pages,
+    or after each chunk with workers.
+    """
+    if workers <= 1:
+        for i, page in enumerate(pages):
+            if i % 100 == 0 and i > 0:
+                progress(i)
+            correct_page(corrector, page, threshold)
+        return
+
+    starts = range(0, len(pages), CHUNK_PAGES)
+    chunks = (pages[start:start + CHUNK_PAGES] for start in starts)
+    with Pool(workers, initializer=_init_worker, initargs=(corrector, threshold)) as pool:
+        for start, (corrected, corrections_made) in zip(starts, pool.imap(_correct_chunk, chunks)):
+            done = start + len(corrected)
+            pages[start:done] = corrected
+            corrector.add_corrections(corrections_made)
+            if done < len(pages):
+                progress(done)
+
+
+def _init_worker(corrector, threshold):
+    """Pool initializer: keep this worker's copy of the corrector and the threshold."""
+    global _worker_corrector, _worker_threshold
+    _worker_corrector = corrector
+    _worker_threshold = threshold
+
+
+def _correct_chunk(pages):
+    """Pool task: correct a chunk of pages, returning them with the corrections made."""
+    corrector = _worker_corrector
+    corrector.corrections_made = Counter()
+    return [correct_page(corrector, page, _worker_threshold) for page in pages], corrector.corrections_made
@@ -0,0 +1,175 @@
+"""
+Levenshtein edit distance shared by the OCR error finders and correctors.
+
+levenshtein_distance(s1, s2, score_cutoff=None) takes the fastest backend
+installed: rapidfuzz, then python-Levenshtein, then a pure-Python
+fallback. With score_cutoff, any distance above it is reported as
+score_cutoff + 1 (rapidfuzz's convention) by every backend.
+
+build_deletion_index and find_within look words up within a small
+distance of a dictionary through a SymSpell deletion index.
+"""
+
+from array import array
+from collections import defaultdict
+
+NATIVE_LEVENSHTEIN = True
+
+def _myers_distance(s1, s2, score_cutoff=None):
+    """
+    Bit-parallel edit distance (Myers/Hyyro) for 1 <= len(s2) <= 64.
+
+    The DP column for s2 is kept as two bit vectors (VP/VN), so each
+    character of s1 costs a fixed handful of integer operations instead
+    of a full row of Python-level min() calls.
+    """
+    peq = {}
+    bit = 1
+    for c in s2:
+        peq[c] = peq.get(c, 0) | bit
+        bit <<= 1
+    mask = bit - 1
+    last = bit >> 1
+
+    vp = mask
+    vn = 0
+    score = len(s2)
+    remaining = len(s1)
+    for c in s1:
+        eq = peq.get(c, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | (~(xh | vp) & mask)
+        hn = vp & xh
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        remaining -= 1
+        # Score can fall by at most one per remaining character
+        if score_cutoff is not None and score - remaining > score_cutoff:
+            return score_cutoff + 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = hn | (~(xv | hp) & mask)
+        vn = hp & xv
+    return score
+
+def _banded_distance(s1, s2, k):
+    """
+    Edit distance for len(s1) >= len(s2) >= 1, with anything above k
+    reported as k + 1.
+
+    Only cells within k of the diagonal can lie on a path of cost <= k;
+    everything outside the band is held at k + 1.
+    """
+    if len(s1) - len(s2) > k:
+        return k + 1
+    n = len(s2)
+    # Single row updated in place; diag holds the cell to the upper-left
+    # before it is overwritten
+    row = array('i', [min(j, k + 1) for j in range(n + 1)])
+    for i, c1 in enumerate(s1, 1):
+        lo = max(1, i - k)
+        hi = min(n, i + k)
+        diag = row[lo - 1]
+        row[lo - 1] = i if lo == 1 else k + 1
+        row_min = row[lo - 1]
+        for j in range(lo, hi + 1):
+            insertions = row[j] + 1
+            deletions = row[j - 1] + 1
+            substitutions = diag + (c1 != s2[j - 1])
+            diag = row[j]
+            value = min(insertions, deletions, substitutions)
+            row[j] = value
+            if value < row_min:
+                row_min = value
+        # Distances never decrease from one row to the next
+        if row_min > k:
+            return k + 1
+    return min(row[n], k + 1)
+
+def _python_distance(s1, s2, score_cutoff=None):
+    """Pure-Python levenshtein_distance: Myers for short words, banded DP beyond 64 characters."""
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    if len(s2) == 0:
+        distance = len(s1)
+    elif len(s2) <= 64:
+        distance = _myers_distance(s1, s2, score_cutoff)
+    else:
+        distance = _banded_distance(s1, s2, len(s1) if score_cutoff is None else score_cutoff)
+
+    if score_cutoff is not None and distance > score_cutoff:
+        return score_cutoff + 1
+    return distance
+
+try:
+    from rapidfuzz.distance.Levenshtein import distance as levenshtein_distance
+except ImportError:
+    try:
+        from Levenshtein import distance as _c_distance
+    except ImportError:
+        NATIVE_LEVENSHTEIN = False
+        levenshtein_distance = _python_distance
+    else:
+        try:
+            _c_distance('', '', score_cutoff=0)
+        except TypeError:
+            # python-Levenshtein releases before 0.18 take no score_cutoff
+            def levenshtein_distance(s1, s2, score_cutoff=None):
+                """python-Levenshtein's distance, capped at score_cutoff + 1"""
+                distance = _c_distance(s1, s2)
+                if score_cutoff is not None and distance > score_cutoff:
+                    return score_cutoff + 1
+                return distance
+        else:
+            levenshtein_distance = _c_distance
+
+def deletes_within(word, max_distance):
+    """All strings reachable from word by deleting up to max_distance characters"""
+    results = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for w in frontier:
+            for i in range(len(w)):
+                next_frontier.add(w[:i] + w[i + 1:])
+        results |= next_frontier
+        frontier = next_frontier
+    return results
+
+def build_deletion_index(words, max_distance):
+    """Map each <=max_distance deletion of every word to the words it came from (SymSpell)"""
+    deletes = defaultdict(list)
+    for word in words:
+        for deleted in deletes_within(word, max_distance):
+            deletes[deleted].append(word)
+    return dict(deletes)
+
+def find_within(word, deletion_index, max_distance, first_letter_window=None):
+    """
+    (indexed word, distance) for every word in deletion_index within
+    max_distance of word, other than word itself, in alphabetical order.
+
+    Any two words within max_distance share a string reachable from both
+    by at most max_distance deletions, so the index yields every match
+    without a scan. With first_letter_window, words whose first letter is
+    more than that many code points from word's are skipped.
+    """
+    possible = set()
+    for deleted in deletes_within(word, max_distance):
+        originals = deletion_index.get(deleted)
+        if originals:
+            possible.update(originals)
+
+    first = ord(word[0]) if word else 0
+    matches = []
+    for candidate in sorted(possible):
+        if first_letter_window is not None and abs(ord(candidate[0]) - first) > first_letter_window:
+            continue
+        distance = levenshtein_distance(word, candidate, score_cutoff=max_distance)
+        if 0 < distance <= max_distance:
+            matches.append((candidate, distance))
+    return matches
+
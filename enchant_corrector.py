@@ -9,16 +9,28 @@ Two-stage validation:
 This prevents false positives while catching real OCR errors.
 """
 
-import json
+import os
 import re
 import enchant
 from collections import Counter
-from typing import Dict, List, Tuple, Set
+from contextlib import ExitStack
+from multiprocessing import Pool
+from typing import Dict, Iterable, List, Tuple, Set
 import time
 
+from corpus_words import count_words
+from edit_distance import levenshtein_distance
+from json_io import CorpusWriter, PageSource, atomic_open, write_json_indented
+
+# Words are alphabetic, keeping hyphens and apostrophes within words
+WORD_RE = re.compile(r"\b[A-Za-z](?:[A-Za-z\-\']*[A-Za-z])?\b")
+
+# The WORD_RE matches of 3+ characters (the only ones worth correcting)
+CANDIDATE_RE = re.compile(r"\b[A-Za-z][A-Za-z\-\']+[A-Za-z]\b")
+
 
 class HybridSpellChecker:
-    def __init__(self, ocr_file: str):
+    def __init__(self, ocr_file: str, verbose: bool = True):
         self.ocr_file = ocr_file
         self.dict = enchant.Dict("en_GB")  # British English for 1834 Parliament
         self.word_counts = Counter()
@@ -26,6 +38,11 @@ class HybridSpellChecker:
         self.words_checked = 0
         self.words_invalid = 0
 
+        # Per-word caches for get_correction (see build_corpus_frequency)
+        self._valid_words = set()
+        self._invalid_words = set()
+        self._correction_cache = {}
+
         # Historical spellings commonly found in 1834 texts
         # Add these to the dictionary so they're not flagged as errors
         historical_spellings = [
@@ -62,24 +79,43 @@ class HybridSpellChecker:
         # Add all whitelisted words
         for word in historical_spellings + proper_nouns:
             self.dict.add(word)
+        # Also kept as a set so get_correction can skip the dictionary call
+        self.whitelist = frozenset(historical_spellings + proper_nouns)
+        self._valid_words.update(self.whitelist)
 
-        print(f"✓ Initialized hybrid spell checker with en_GB dictionary")
-        print(f"✓ Added {len(historical_spellings)} historical spellings to whitelist")
-        print(f"✓ Added {len(proper_nouns)} proper nouns to whitelist (Iterations 1-5 FINAL)")
+        if verbose:
+            print(f"✓ Initialized hybrid spell checker with en_GB dictionary")
+            print(f"✓ Added {len(historical_spellings)} historical spellings to whitelist")
+            print(f"✓ Added {len(proper_nouns)} proper nouns to whitelist (Iterations 1-5 FINAL)")
 
-    def build_corpus_frequency(self, pages: List[dict]) -> None:
-        """Build word frequency dictionary from the entire corpus."""
+    def build_corpus_frequency(self, pages: Iterable[dict]) -> int:
+        """Build word frequency dictionary from the entire corpus; returns the page count."""
         print("\nBuilding corpus frequency dictionary...")
 
-        for page in pages:
-            text = page.get('markdown', '')
-            # Extract words (alphanumeric, keeping hyphens within words)
-            words = re.findall(r'\b[A-Za-z](?:[A-Za-z\-\']*[A-Za-z])?\b', text)
-            self.word_counts.update(words)
+        # Cached corrections were scored against the old counts
+        self._correction_cache.clear()
+
+        page_count = count_words(pages, WORD_RE, self.word_counts)
 
         print(f"✓ Built frequency dictionary: {len(self.word_counts)} unique words")
         print(f"  Total word occurrences: {sum(self.word_counts.values()):,}")
 
+        # Check each unique word correct_text will look up against the
+        # dictionary once, so correcting the pages only needs set lookups
+        # (get_correction still checks anything missed here lazily)
+        for word in self.word_counts:
+            if word in self._valid_words or word in self._invalid_words:
+                continue
+            if not CANDIDATE_RE.fullmatch(word) or self._skip_word(word):
+                continue
+            if self.dict.check(word):
+                self._valid_words.add(word)
+            else:
+                self._invalid_words.add(word)
+        print(f"  Candidate words not in dictionary: {len(self._invalid_words):,}")
+
+        return page_count
+
     def get_correction(self, word: str) -> Tuple[str, float]:
         """
         Get correction for a word with confidence score.
@@ -90,12 +126,27 @@ class HybridSpellChecker:
         """
         self.words_checked += 1
 
-        # Check if word is valid according to dictionary
-        if self.dict.check(word):
+        # Check if word is valid according to dictionary (corpus words and
+        # the whitelist were classified up front)
+        if word in self._valid_words:
             return (word, 0.0)
+        if word not in self._invalid_words:
+            if self.dict.check(word):
+                self._valid_words.add(word)
+                return (word, 0.0)
+            self._invalid_words.add(word)
 
         self.words_invalid += 1
 
+        # The same token recurs many times across the corpus; the result
+        # only depends on the word and the (fixed) corpus counts
+        correction = self._correction_cache.get(word)
+        if correction is None:
+            correction = self._correction_cache[word] = self._compute_correction(word)
+        return correction
+
+    def _compute_correction(self, word: str) -> Tuple[str, float]:
+        """Uncached body of get_correction for a word the dictionary rejects."""
         # Get suggestions from enchant
         suggestions = self.dict.suggest(word)
 
@@ -103,14 +154,15 @@ class HybridSpellChecker:
             return (word, 0.0)  # No suggestions available
 
         top_suggestion = suggestions[0]
+        suggestion_lower = top_suggestion.lower()
 
         # Check if suggestion appears in corpus
         # We check both exact case and lowercase to handle proper nouns
-        suggestion_count = self.word_counts.get(top_suggestion, 0)
-        suggestion_count_lower = self.word_counts.get(top_suggestion.lower(), 0)
-        total_suggestion_count = suggestion_count + suggestion_count_lower
+        # (Counter indexing returns 0 for missing words)
+        word_counts = self.word_counts
+        total_suggestion_count = word_counts[top_suggestion] + word_counts[suggestion_lower]
 
-        original_count = self.word_counts.get(word, 0)
+        original_count = word_counts[word]
 
         # Calculate confidence based on:
         # 1. How common the suggestion is in corpus
@@ -122,7 +174,8 @@ class HybridSpellChecker:
             return (word, 0.0)
 
         # Calculate edit distance (Levenshtein)
-        edit_dist = self._edit_distance(word.lower(), top_suggestion.lower())
+        # Only distances up to 3 affect the score, so stop counting there
+        edit_dist = levenshtein_distance(word.lower(), suggestion_lower, score_cutoff=3)
 
         # Confidence scoring
         confidence = 0.0
@@ -155,25 +208,10 @@ class HybridSpellChecker:
 
         return (top_suggestion, confidence)
 
-    def _edit_distance(self, s1: str, s2: str) -> int:
-        """Calculate Levenshtein edit distance between two strings."""
-        if len(s1) < len(s2):
-            return self._edit_distance(s2, s1)
-
-        if len(s2) == 0:
-            return len(s1)
-
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-
-        return previous_row[-1]
+    @staticmethod
+    def _skip_word(word: str) -> bool:
+        """Whether correct_text leaves a candidate alone: all-caps words longer than 4 chars (likely headers/acronyms)"""
+        return word.isupper() and len(word) > 4
 
     def correct_text(self, text: str, min_confidence: float = 0.7) -> Tuple[str, List[dict]]:
         """
@@ -187,19 +225,14 @@ class HybridSpellChecker:
             (corrected_text, corrections_list)
         """
         corrections_in_text = []
+        replacements = {}
 
-        # Split into words while preserving structure
-        # Use regex to find word boundaries and keep everything else
-        def replace_word(match):
-            word = match.group(0)
-
-            # Skip very short words (likely abbreviations or noise)
-            if len(word) <= 2:
-                return word
-
-            # Skip all-caps words longer than 4 chars (likely headers/acronyms)
-            if word.isupper() and len(word) > 4:
-                return word
+        # Only words of 3+ letters are considered (shorter ones are likely
+        # abbreviations or noise); the regex drops the rest before Python
+        # sees them
+        for word in CANDIDATE_RE.findall(text):
+            if self._skip_word(word):
+                continue
 
             corrected, confidence = self.get_correction(word)
 
@@ -209,30 +242,42 @@ class HybridSpellChecker:
                     'correction': corrected,
                     'confidence': round(confidence, 2)
                 })
-                return corrected
-
-            return word
+                replacements[word] = corrected
 
-        corrected_text = re.sub(r'\b[A-Za-z](?:[A-Za-z\-\']*[A-Za-z])?\b', replace_word, text)
+        # Most pages need no changes; otherwise substitute from the map
+        if not replacements:
+            return text, corrections_in_text
+        corrected_text = CANDIDATE_RE.sub(lambda m: replacements.get(m.group(0), m.group(0)), text)
 
         return corrected_text, corrections_in_text
 
-    def process_pages(self, min_confidence: float = 0.7) -> dict:
+    def process_pages(self, min_confidence: float = 0.7, workers: int = None,
+                      output_file: str = None) -> dict:
         """
         Process all pages and apply corrections.
 
+        Args:
+            min_confidence: Minimum confidence to auto-apply correction (0.0-1.0)
+            workers: Worker processes for correction (default: CPU count;
+                1 corrects in this process)
+            output_file: If given, corrected pages are written here as they
+                are produced instead of being kept in memory ('data' is None)
+
         Returns:
             Dictionary with corrected pages and statistics
         """
         print(f"\nLoading OCR data from {self.ocr_file}...")
-        with open(self.ocr_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        pages = data.get('pages', [])
-        print(f"✓ Loaded {len(pages)} pages")
-
-        # Build frequency dictionary first
-        self.build_corpus_frequency(pages)
+        # With ijson the file is streamed twice (counting, then correcting)
+        # rather than holding every original page in memory
+        source = PageSource(self.ocr_file)
+        if not source.streaming:
+            print(f"✓ Loaded {source.page_count} pages")
+        page_count = self.build_corpus_frequency(source.iter_pages())
+        if source.streaming:
+            print(f"✓ Streamed {page_count} pages")
+        # The counting pass has filled in the top-level fields
+        top_level = source.fields
+        pages = source.iter_pages()
 
         # Process pages
         print(f"\nProcessing pages with spell correction (min confidence: {min_confidence})...")
@@ -241,40 +286,69 @@ class HybridSpellChecker:
         corrected_pages = []
         page_corrections = {}
 
-        for i, page in enumerate(pages):
-            if i % 500 == 0:
-                elapsed = time.time() - start_time
-                rate = i / elapsed if elapsed > 0 else 0
-                print(f"  Processing page {i}/{len(pages)} ({rate:.1f} pages/sec)")
-
-            original_markdown = page.get('markdown', '')
-            corrected_markdown, corrections = self.correct_text(original_markdown, min_confidence)
-
-            corrected_page = page.copy()
-            corrected_page['markdown'] = corrected_markdown
-            corrected_pages.append(corrected_page)
-
-            if corrections:
-                page_corrections[page.get('index', i)] = corrections
-                self.corrections_applied.extend(corrections)
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        with ExitStack() as stack:
+            if output_file:
+                # Pages are written as they are corrected, in json.dump's
+                # layout; the file replaces output_file only once every page
+                # is written
+                out = CorpusWriter(stack.enter_context(atomic_open(output_file)), top_level, indent=False)
+            else:
+                out = None
+
+            if workers > 1:
+                # enchant dictionaries can't be pickled, so each worker builds its
+                # own checker and receives the corpus counts once at startup
+                pool = stack.enter_context(Pool(workers, initializer=_init_worker,
+                                                initargs=(self.ocr_file, self.word_counts, self._valid_words,
+                                                          self._invalid_words, min_confidence)))
+                results = pool.imap(_correct_page, pages, chunksize=50)
+            else:
+                results = (self._correct_page(page, min_confidence) for page in pages)
+
+            for i, (corrected_page, corrections, words_checked, words_invalid) in enumerate(results):
+                if i % 500 == 0:
+                    elapsed = time.time() - start_time
+                    rate = i / elapsed if elapsed > 0 else 0
+                    print(f"  Processing page {i}/{page_count} ({rate:.1f} pages/sec)")
+
+                self.words_checked += words_checked
+                self.words_invalid += words_invalid
+
+                if out is not None:
+                    out.write_page(corrected_page)
+                else:
+                    corrected_pages.append(corrected_page)
+
+                if corrections:
+                    page_corrections[corrected_page.get('index', i)] = corrections
+                    self.corrections_applied.extend(corrections)
+
+            if out is not None:
+                out.finish()
 
         elapsed = time.time() - start_time
-        rate = len(pages) / elapsed
+        rate = page_count / elapsed
 
-        print(f"\n✓ Processed {len(pages)} pages in {elapsed:.1f}s ({rate:.1f} pages/sec)")
+        print(f"\n✓ Processed {page_count} pages in {elapsed:.1f}s ({rate:.1f} pages/sec)")
         print(f"  Words checked: {self.words_checked:,}")
         print(f"  Words flagged as invalid by dictionary: {self.words_invalid:,}")
         print(f"  Corrections applied: {len(self.corrections_applied):,}")
 
         # Prepare output data
-        output_data = data.copy()
-        output_data['pages'] = corrected_pages
+        if out is not None:
+            output_data = None
+        else:
+            output_data = dict(top_level)
+            output_data['pages'] = corrected_pages
 
         return {
             'data': output_data,
             'corrections': page_corrections,
             'stats': {
-                'pages_processed': len(pages),
+                'pages_processed': page_count,
                 'words_checked': self.words_checked,
                 'words_invalid': self.words_invalid,
                 'corrections_applied': len(self.corrections_applied),
@@ -283,6 +357,26 @@ class HybridSpellChecker:
             }
         }
 
+    def _correct_page(self, page: dict, min_confidence: float) -> Tuple[dict, List[dict], int, int]:
+        """
+        Correct one page's markdown.
+
+        Returns:
+            (corrected_page, corrections, words_checked, words_invalid),
+            with the word counts covering this page only
+        """
+        checked_before = self.words_checked
+        invalid_before = self.words_invalid
+        corrected_markdown, corrections = self.correct_text(page.get('markdown', ''), min_confidence)
+        corrected_page = page.copy()
+        corrected_page['markdown'] = corrected_markdown
+        checked = self.words_checked - checked_before
+        invalid = self.words_invalid - invalid_before
+        # The caller adds the per-page counts back on
+        self.words_checked = checked_before
+        self.words_invalid = invalid_before
+        return corrected_page, corrections, checked, invalid
+
     def get_correction_summary(self) -> dict:
         """Get summary of corrections by type."""
         correction_types = Counter()
@@ -298,6 +392,27 @@ class HybridSpellChecker:
         }
 
 
+# Per-process state for the correction workers in process_pages
+_worker_checker = None
+_worker_min_confidence = 0.7
+
+
+def _init_worker(ocr_file: str, word_counts: Counter, valid_words: Set[str],
+                 invalid_words: Set[str], min_confidence: float) -> None:
+    """Pool initializer: build this worker's checker around the shared counts."""
+    global _worker_checker, _worker_min_confidence
+    _worker_checker = HybridSpellChecker(ocr_file, verbose=False)
+    _worker_checker.word_counts = word_counts
+    _worker_checker._valid_words = valid_words
+    _worker_checker._invalid_words = invalid_words
+    _worker_min_confidence = min_confidence
+
+
+def _correct_page(page: dict) -> Tuple[dict, List[dict], int, int]:
+    """Pool task: correct one page in this worker."""
+    return _worker_checker._correct_page(page, _worker_min_confidence)
+
+
 def main():
     import sys
 
@@ -319,13 +434,9 @@ def main():
     # Initialize checker
     checker = HybridSpellChecker(input_file)
 
-    # Process pages
-    result = checker.process_pages(min_confidence=min_confidence)
-
-    # Save corrected data
-    print(f"\nSaving corrected data to {output_file}...")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result['data'], f, ensure_ascii=False)
+    # Process pages, writing corrected data as it is produced
+    print(f"\nCorrected data will be streamed to {output_file}")
+    result = checker.process_pages(min_confidence=min_confidence, output_file=output_file)
     print(f"✓ Saved corrected OCR data")
 
     # Generate summary
@@ -345,8 +456,7 @@ def main():
         ]
     }
 
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    write_json_indented(report_file, report)
     print(f"✓ Saved correction report")
 
     # Print summary
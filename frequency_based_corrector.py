@@ -4,11 +4,16 @@ Frequency-Based OCR Corrector
 Uses actual error candidates discovered from corpus analysis to fix OCR errors.
 """
 
+import heapq
 import json
+import os
 import re
 import time
 from collections import Counter
-from pathlib import Path
+from itertools import islice
+
+from correction_pool import correct_page, correct_pages
+from json_io import PageSource, load_json, write_json_indented
 
 class FrequencyBasedCorrector:
     """Corrector based on frequency analysis of actual corpus"""
@@ -16,7 +21,10 @@ class FrequencyBasedCorrector:
     def __init__(self, error_analysis_path='ocr-error-analysis.json', confidence_threshold=0.85):
         self.confidence_threshold = confidence_threshold
         self.corrections = {}  # rare_word -> (correct_word, confidence)
-        self.corrections_made = Counter()
+        self.corrections_made = Counter()  # original word -> times corrected
+        self.total_corrections = 0  # sum of corrections_made, kept as it grows
+        self._word_re = re.compile(r'\b([A-Za-z]+)\b')
+        self._apply_cases = {}  # rare_word -> (correct_word, Correct_word), for correct_text
 
         self._load_error_analysis(error_analysis_path)
 
@@ -24,8 +32,7 @@ class FrequencyBasedCorrector:
         """Load error analysis and build correction lookup"""
         print(f"Loading error analysis from {path}...")
 
-        with open(path, 'r', encoding='utf-8') as f:
-            analysis = json.load(f)
+        analysis = load_json(path)
 
         error_candidates = analysis.get('error_candidates', [])
         print(f"✓ Loaded {len(error_candidates)} error candidates")
@@ -36,6 +43,8 @@ class FrequencyBasedCorrector:
         # Track skipped corrections for reporting
         skipped_proper_nouns = 0
         skipped_all_caps = 0
+        corrections = self.corrections
+        threshold = self.confidence_threshold
 
         for candidate in error_candidates:
             rare_word = candidate.get('rare_word')
@@ -89,26 +98,26 @@ class FrequencyBasedCorrector:
                 confidence -= 0.10
 
             # Only add if confidence meets threshold
-            if confidence >= self.confidence_threshold:
+            if confidence >= threshold:
                 # Prefer higher confidence if we already have a correction
-                if rare_word in self.corrections:
-                    existing_conf = self.corrections[rare_word][1]
-                    if confidence > existing_conf:
-                        self.corrections[rare_word] = (correct_word, confidence)
-                else:
-                    self.corrections[rare_word] = (correct_word, confidence)
+                existing = corrections.get(rare_word)
+                if existing is None or confidence > existing[1]:
+                    corrections[rare_word] = (correct_word, confidence)
+
+        # Hot-path view for correct_text: lowercase word -> replacement as
+        # is and capitalized, so case handling is an index, not a string op
+        self._apply_cases = {
+            rare_word: (correct_word, correct_word.capitalize())
+            for rare_word, (correct_word, _) in self.corrections.items()
+        }
 
         print(f"✓ Built lookup with {len(self.corrections)} high-confidence corrections (≥{self.confidence_threshold})")
         print(f"  Skipped {skipped_proper_nouns} capitalized proper nouns (titles, names, places)")
         print(f"  Skipped {skipped_all_caps} all-caps words (acronyms, headers)")
 
-        # Show top 20 corrections
+        # Show top 20 corrections (nlargest keeps sorted()'s order for ties)
         print("\nTop 20 corrections to be applied:")
-        sorted_corrections = sorted(
-            self.corrections.items(),
-            key=lambda x: x[1][1],
-            reverse=True
-        )[:20]
+        sorted_corrections = heapq.nlargest(20, self.corrections.items(), key=lambda x: x[1][1])
 
         for rare_word, (correct_word, conf) in sorted_corrections:
             print(f"  {rare_word:20s} → {correct_word:20s} (confidence: {conf:.2f})")
@@ -138,20 +147,57 @@ class FrequencyBasedCorrector:
 
     def correct_text(self, text: str, threshold: float = 0.85) -> str:
         """Correct all words in text above confidence threshold"""
-        def replace_word(match):
-            word = match.group(0)
-            corrected, confidence = self.correct_word(word)
+        # Split once: words land at odd indices, the text between them at
+        # even ones, so joining the parts back preserves positions
+        parts = self._word_re.split(text)
+
+        # Every loaded correction already meets confidence_threshold, so
+        # only a stricter threshold needs filtering; a looser one cannot
+        # bring back corrections that were never loaded
+        if threshold <= self.confidence_threshold:
+            apply = self._apply_cases
+        else:
+            apply = {k: v for k, v in self._apply_cases.items() if self.corrections[k][1] >= threshold}
 
-            if confidence >= threshold and corrected != word:
-                self.corrections_made[(word, corrected)] += 1
-                return corrected
-            return word
+        for i in range(1, len(parts), 2):
+            word = parts[i]
+            # Most words have no correction: one lookup and move on
+            cases = apply.get(word.lower())
+            if cases is None:
+                continue
 
-        # Replace words while preserving positions
-        return re.sub(r'\b[A-Za-z]+\b', replace_word, text)
+            # Same rules as correct_word: leave proper nouns and all-caps
+            # words alone, and carry over a leading capital
+            initial_upper = word[0].isupper()
+            if initial_upper and len(word) > 1 and (word[1:].islower() or word.isupper()):
+                continue
+            corrected = cases[initial_upper]
+
+            if corrected != word:
+                # The replacement follows from the word; see _corrections_by_pair
+                self.corrections_made[word] += 1
+                self.total_corrections += 1
+                parts[i] = corrected
+
+        return ''.join(parts)
+
+    def add_corrections(self, corrections_made: Counter):
+        """Merge in corrections_made counts from another copy of this corrector"""
+        self.corrections_made.update(corrections_made)
+        self.total_corrections += sum(corrections_made.values())
+
+    def process_file(self, input_path: str, output_path: str, sample: int = None,
+                     workers: int = None, streaming: bool = False):
+        """
+        Process JSON file and write corrected version (workers: processes,
+        default CPU count). With streaming, see process_file_streaming;
+        pages are then corrected in this process and workers is ignored.
+        """
+        if streaming:
+            if workers is not None and workers > 1:
+                print(f"Warning: ignoring workers={workers} when streaming; pages are corrected in this process")
+            return self.process_file_streaming(input_path, output_path, sample)
 
-    def process_file(self, input_path: str, output_path: str, sample: int = None):
-        """Process JSON file and write corrected version"""
         print(f"\n=== Frequency-Based OCR Corrector ===")
         print(f"Input: {input_path}")
         print(f"Output: {output_path}")
@@ -159,8 +205,7 @@ class FrequencyBasedCorrector:
 
         # Load
         print("Loading OCR data...")
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(input_path)
 
         pages = data.get('pages', [])
         total_pages = len(pages)
@@ -175,46 +220,96 @@ class FrequencyBasedCorrector:
         print("Correcting pages...")
         start_time = time.time()
 
-        for i, page in enumerate(pages):
-            if i % 100 == 0 and i > 0:
-                elapsed = time.time() - start_time
-                rate = i / elapsed
-                eta = (len(pages) - i) / rate
-                total_corrections = sum(self.corrections_made.values())
-                print(f"  Page {i}/{len(pages)} ({rate:.1f} pages/sec, ETA: {eta/60:.1f} min, {total_corrections} corrections)")
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        def progress(i):
+            elapsed = time.time() - start_time
+            rate = i / elapsed
+            eta = (len(pages) - i) / rate
+            print(f"  Page {i}/{len(pages)} ({rate:.1f} pages/sec, ETA: {eta/60:.1f} min, {self.total_corrections} corrections)")
 
-            # Correct the markdown
-            if 'markdown' in page:
-                page['markdown'] = self.correct_text(page['markdown'], self.confidence_threshold)
+        correct_pages(self, pages, workers, progress, self.confidence_threshold)
 
         elapsed = time.time() - start_time
         print(f"\n✓ Processed {len(pages)} pages in {elapsed:.1f}s ({len(pages)/elapsed:.1f} pages/sec)\n")
 
-        # Report corrections
+        self._report_corrections()
+
+        # Write
+        print(f"\n=== Writing Output ===")
+        data['pages'] = pages
+        write_json_indented(output_path, data)
+        print(f"✓ Wrote: {output_path}")
+
+        self._write_report(output_path, len(pages))
+
+    def process_file_streaming(self, input_path: str, output_path: str, sample: int = None):
+        """
+        Stream pages from the JSON file and write corrected pages as JSONL
+        (one page per line) to output_path + 'l', so neither the input nor
+        the output corpus is held in memory.
+        """
+        jsonl_path = output_path + 'l'
+        print(f"\n=== Frequency-Based OCR Corrector (streaming) ===")
+        print(f"Input: {input_path}")
+        print(f"Output: {jsonl_path}")
+        print(f"Confidence threshold: {self.confidence_threshold}\n")
+
+        pages = PageSource(input_path).iter_pages()
+        if sample:
+            pages = islice(pages, sample)
+            print(f"Processing first {sample} pages (sample mode)\n")
+
+        print("Correcting pages...")
+        start_time = time.time()
+        page_count = 0
+
+        with open(jsonl_path, 'w', encoding='utf-8') as out:
+            for i, page in enumerate(pages):
+                if i % 100 == 0 and i > 0:
+                    elapsed = time.time() - start_time
+                    print(f"  Page {i} ({i / elapsed:.1f} pages/sec, {self.total_corrections} corrections)")
+
+                correct_page(self, page, self.confidence_threshold)
+                out.write(json.dumps(page, ensure_ascii=False))
+                out.write('\n')
+                page_count += 1
+
+        elapsed = time.time() - start_time
+        print(f"\n✓ Processed {page_count} pages in {elapsed:.1f}s ({page_count/elapsed:.1f} pages/sec)\n")
+
+        self._report_corrections()
+        print(f"\n✓ Wrote: {jsonl_path}")
+
+        self._write_report(output_path, page_count)
+
+    def _report_corrections(self):
+        """Print a summary of the corrections applied so far"""
         print("=== Corrections Applied ===")
-        total_corrections = sum(self.corrections_made.values())
-        print(f"Total: {total_corrections} corrections across {len(self.corrections_made)} unique error types\n")
+        print(f"Total: {self.total_corrections} corrections across {len(self.corrections_made)} unique error types\n")
 
         if self.corrections_made:
             print("Top 50 corrections applied:")
-            for (original, corrected), count in self.corrections_made.most_common(50):
+            for (original, corrected), count in self._corrections_by_pair(50):
                 confidence = self.corrections.get(original, self.corrections.get(original.lower(), (None, 0)))[1]
                 print(f"  {original:20s} → {corrected:20s} ({count:3d}x, conf: {confidence:.2f})")
         else:
             print("  No corrections made (threshold may be too high)")
 
-        # Write
-        print(f"\n=== Writing Output ===")
-        data['pages'] = pages
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"✓ Wrote: {output_path}")
+    def _corrections_by_pair(self, n=None):
+        """((original, corrected), count) for the n most common corrections made"""
+        return [
+            ((word, self._apply_cases[word.lower()][word[0].isupper()]), count)
+            for word, count in self.corrections_made.most_common(n)
+        ]
 
-        # Write report
+    def _write_report(self, output_path: str, pages_processed: int):
+        """Write the corrections report next to output_path"""
         report_path = output_path.replace('.json', '-frequency-report.json')
         report = {
-            'total_pages_processed': len(pages),
-            'total_corrections': total_corrections,
+            'total_pages_processed': pages_processed,
+            'total_corrections': self.total_corrections,
             'unique_error_types': len(self.corrections_made),
             'confidence_threshold': self.confidence_threshold,
             'available_corrections': len(self.corrections),
@@ -225,11 +320,10 @@ class FrequencyBasedCorrector:
                     'count': count,
                     'confidence': self.corrections.get(orig, self.corrections.get(orig.lower(), (None, 0)))[1]
                 }
-                for (orig, corr), count in self.corrections_made.most_common()
+                for (orig, corr), count in self._corrections_by_pair()
             ]
         }
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        write_json_indented(report_path, report)
         print(f"✓ Wrote report: {report_path}")
 
 
@@ -246,11 +340,15 @@ def main():
     parser.add_argument('--threshold', type=float, default=0.85,
                        help='Confidence threshold for applying corrections (default: 0.85)')
     parser.add_argument('--sample', type=int, help='Process only first N pages')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--streaming', action='store_true',
+                       help='Stream pages (with ijson if installed) and write them as JSON Lines '
+                            'to OUTPUT + "l" (e.g. corrected.jsonl), in one process (ignores --workers)')
 
     args = parser.parse_args()
 
     corrector = FrequencyBasedCorrector(args.analysis, args.threshold)
-    corrector.process_file(args.input, args.output, args.sample)
+    corrector.process_file(args.input, args.output, args.sample, args.workers, args.streaming)
 
 
 if __name__ == '__main__':
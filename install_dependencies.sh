@@ -1,12 +1,12 @@
 #!/bin/bash
-# Install optional dependencies for OCR corrector
+# Install optional dependencies for the OCR scripts
 # These are recommended but not required - the script has fallbacks
 
-echo "Installing optional dependencies for parliamentary_ocr_corrector.py..."
+echo "Installing optional dependencies for the OCR scripts..."
 echo ""
 
 # Try to install pyenchant
-echo "1/2 Installing pyenchant (modern English dictionary)..."
+echo "1/5 Installing pyenchant (modern English dictionary)..."
 pip install pyenchant 2>/dev/null
 if [ $? -eq 0 ]; then
     echo "✓ pyenchant installed successfully"
@@ -17,7 +17,7 @@ fi
 echo ""
 
 # Try to install python-Levenshtein
-echo "2/2 Installing python-Levenshtein (fast edit distance)..."
+echo "2/5 Installing python-Levenshtein (fast edit distance)..."
 pip install python-Levenshtein 2>/dev/null
 if [ $? -eq 0 ]; then
     echo "✓ python-Levenshtein installed successfully"
@@ -25,6 +25,39 @@ else
     echo "⚠ python-Levenshtein installation failed (will use slower fallback)"
 fi
 
+echo ""
+
+# Try to install rapidfuzz
+echo "3/5 Installing rapidfuzz (fast fuzzy matching)..."
+pip install rapidfuzz 2>/dev/null
+if [ $? -eq 0 ]; then
+    echo "✓ rapidfuzz installed successfully"
+else
+    echo "⚠ rapidfuzz installation failed (will use slower fallback)"
+fi
+
+echo ""
+
+# Try to install orjson
+echo "4/5 Installing orjson (fast JSON parsing)..."
+pip install orjson 2>/dev/null
+if [ $? -eq 0 ]; then
+    echo "✓ orjson installed successfully"
+else
+    echo "⚠ orjson installation failed (will use slower fallback)"
+fi
+
+echo ""
+
+# Try to install ijson
+echo "5/5 Installing ijson (streaming JSON parsing)..."
+pip install ijson 2>/dev/null
+if [ $? -eq 0 ]; then
+    echo "✓ ijson installed successfully"
+else
+    echo "⚠ ijson installation failed (will load whole files instead)"
+fi
+
 echo ""
 echo "Done! You can now run:"
 echo "  python parliamentary_ocr_corrector.py"
@@ -0,0 +1,198 @@
+"""
+JSON I/O shared by the OCR correctors.
+
+Uses orjson when installed. Everything written here has the layout of
+json.dump(obj, f, indent=2, ensure_ascii=False), with or without orjson,
+and the same bytes except for floats that json writes with an exponent:
+orjson writes 1e-05 as 0.00001 and 2.5e+20 as 2.5e20. Both read back as
+the same float.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+@contextmanager
+def atomic_open(path, mode='wb', **kwargs):
+    """
+    Open a temporary file beside path for writing. It replaces path when
+    the with block completes, and is removed if the block raises, so an
+    interrupted run never leaves a truncated file behind.
+    """
+    tmp_path = f'{path}.tmp'
+    f = open(tmp_path, mode, **kwargs)
+    try:
+        yield f
+    except BaseException:
+        f.close()
+        os.remove(tmp_path)
+        raise
+    f.close()
+    os.replace(tmp_path, path)
+
+def load_json(path):
+    """Load a JSON file, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def dumps_indented(obj):
+    """
+    obj as UTF-8 bytes in the layout of json.dumps(obj, indent=2,
+    ensure_ascii=False), floats aside (see above). OPT_NON_STR_KEYS makes orjson stringify int keys
+    the way json does rather than raise.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _nested(obj, level):
+    """dumps_indented(obj) for a value nested level deep in a document"""
+    # Encoded JSON has no raw newlines inside strings, so nesting a value
+    # deeper is a matter of indenting every line break
+    return dumps_indented(obj).replace(b'\n', b'\n' + b'  ' * level)
+
+def _dumps_compact(obj):
+    """obj as UTF-8 bytes in the layout of json.dumps(obj, ensure_ascii=False)"""
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+def write_json_indented(path, obj):
+    """
+    Write obj to path as dumps_indented lays it out. A top-level dict is
+    encoded member by member, and its lists item by item, so a whole
+    corpus is never held as one encoded buffer.
+    """
+    with open(path, 'wb') as f:
+        if not isinstance(obj, dict) or not obj:
+            f.write(dumps_indented(obj))
+            return
+        separator = b'{\n  '
+        for key, value in obj.items():
+            f.write(separator)
+            separator = b',\n  '
+            f.write(dumps_indented(str(key)) + b': ')
+            if isinstance(value, list) and value:
+                item_separator = b'[\n    '
+                for item in value:
+                    f.write(item_separator)
+                    item_separator = b',\n    '
+                    f.write(_nested(item, 2))
+                f.write(b'\n  ]')
+            else:
+                f.write(_nested(value, 1))
+        f.write(b'\n}')
+
+class CorpusWriter:
+    """
+    Write an OCR corpus, {fields..., "pages": [...]}, to a binary file one
+    page at a time: the top-level fields first, then each page as it is
+    passed to write_page, then finish() to close the document. The layout
+    is dumps_indented's for the whole corpus, or with indent=False that of
+    json.dump(corpus, f, ensure_ascii=False).
+    """
+
+    def __init__(self, file, fields, indent=True):
+        self._file = file
+        self._indent = indent
+        self._pages_written = 0
+        file.write(b'{')
+        for key, value in fields.items():
+            if indent:
+                file.write(b'\n  ' + dumps_indented(key) + b': ' + _nested(value, 1) + b',')
+            else:
+                file.write(_dumps_compact(key) + b': ' + _dumps_compact(value) + b', ')
+        file.write(b'\n  "pages": [' if indent else b'"pages": [')
+
+    def write_page(self, page):
+        if self._indent:
+            self._file.write((b',\n    ' if self._pages_written else b'\n    ') + _nested(page, 2))
+        else:
+            self._file.write((b', ' if self._pages_written else b'') + _dumps_compact(page))
+        self._pages_written += 1
+
+    def finish(self):
+        """Close the pages array and the document (the file stays open)"""
+        if self._indent and self._pages_written:
+            self._file.write(b'\n  ]\n}')
+        else:
+            self._file.write(b']\n}' if self._indent else b']}')
+
+class PageSource:
+    """
+    An OCR JSON file opened for repeated passes over its pages.
+
+    iter_pages() gives a fresh iterator over the pages on each call. With
+    ijson every pass streams the file, so the corpus is never held in
+    memory; fields (the top-level members other than 'pages') and
+    page_count are filled in by the first pass that reads the file to the
+    end, so no pass is spent only counting. Without ijson the file is
+    loaded once, up front.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.streaming = ijson is not None
+        self.fields = {}
+        self.page_count = None
+        if ijson is None:
+            data = load_json(path)
+            self._pages = data.pop('pages', [])
+            self.fields = data
+            self.page_count = len(self._pages)
+
+    def iter_pages(self):
+        """A fresh iterator over the pages"""
+        if not self.streaming:
+            return iter(self._pages)
+        if self.page_count is None:
+            return self._first_pass()
+        return self._stream_pages()
+
+    def _stream_pages(self):
+        with open(self.path, 'rb') as f:
+            yield from ijson.items(f, 'pages.item', use_float=True)
+
+    def _first_pass(self):
+        """Stream the pages, building every other top-level member on the way"""
+        fields = {}
+        page_count = 0
+        key = None
+        depth = 0  # containers open before the current event
+        builder = None
+        with open(self.path, 'rb') as f:
+            for _, event, value in ijson.parse(f, use_float=True):
+                if builder is None:
+                    if depth == 1 and event == 'map_key':
+                        key = value
+                    elif (event not in ('end_map', 'end_array')
+                            and ((depth == 1 and key != 'pages') or (depth == 2 and key == 'pages'))):
+                        # First event of a top-level member or of a page
+                        builder = ijson.ObjectBuilder()
+                        start_depth = depth
+                if builder is not None:
+                    builder.event(event, value)
+                if event in ('start_map', 'start_array'):
+                    depth += 1
+                elif event in ('end_map', 'end_array'):
+                    depth -= 1
+                if builder is not None and depth == start_depth:
+                    if key == 'pages':
+                        page_count += 1
+                        yield builder.value
+                    else:
+                        fields[key] = builder.value
+                    builder = None
+        self.fields = fields
+        self.page_count = page_count
@@ -4,11 +4,13 @@ Simple OCR Corrector - Character Confusion Patterns Only
 Focuses on high-confidence OCR error patterns without dictionary dependence.
 """
 
-import json
+import os
 import re
 import time
 from collections import Counter
-from pathlib import Path
+
+from correction_pool import correct_pages
+from json_io import load_json, write_json_indented
 
 # Character confusion patterns - common OCR errors
 CONFUSION_PATTERNS = {
@@ -43,6 +45,20 @@ class SimpleOCRCorrector:
         self.patterns = CONFUSION_PATTERNS
         self.corrections_made = Counter()
 
+        # All-caps form of each pattern -> upper-cased replacement (first
+        # pattern wins, as in the original scan)
+        self._upper_patterns = {}
+        for pattern, replacement in self.patterns.items():
+            self._upper_patterns.setdefault(pattern.upper(), replacement.upper())
+
+        # Patterns long enough for substring replacement, in priority order,
+        # plus one alternation that tells us whether any of them occur
+        self._substring_patterns = [(p, r) for p, r in self.patterns.items() if len(p) >= 3]
+        self._substring_re = re.compile(
+            '|'.join(re.escape(p) for p, _ in sorted(self._substring_patterns, key=lambda pr: -len(pr[0])))
+        )
+        self._word_re = re.compile(r'\b([A-Za-z]+)\b')
+
     def correct_word(self, word: str) -> tuple[str, float]:
         """Try to correct a single word, return (corrected, confidence)"""
         original = word
@@ -52,54 +68,52 @@ class SimpleOCRCorrector:
             return (self.patterns[word], 0.95)
 
         # Try case-insensitive for all-caps words
-        if word.isupper() and word in [k.upper() for k in self.patterns.keys()]:
-            for pattern, replacement in self.patterns.items():
-                if word == pattern.upper():
-                    return (replacement.upper(), 0.95)
+        if word.isupper() and word in self._upper_patterns:
+            return (self._upper_patterns[word], 0.95)
 
-        # Try substring replacements (more risky)
-        best_correction = word
-        best_confidence = 0.0
+        # Try substring replacements (more risky); one regex scan rules out
+        # most words before trying patterns one by one
+        if not self._substring_re.search(word):
+            return (word, 0.0)
 
-        for pattern, replacement in self.patterns.items():
-            if pattern in word and len(pattern) >= 3:  # Only patterns 3+ chars
+        for pattern, replacement in self._substring_patterns:  # Only patterns 3+ chars
+            if pattern in word:
                 corrected = word.replace(pattern, replacement)
                 if corrected != word:
-                    confidence = 0.85
-                    if confidence > best_confidence:
-                        best_correction = corrected
-                        best_confidence = confidence
-
-        if best_confidence > 0:
-            return (best_correction, best_confidence)
+                    return (corrected, 0.85)
 
         return (word, 0.0)
 
     def correct_text(self, text: str, threshold: float = 0.90) -> str:
         """Correct all words in text above confidence threshold"""
-        # Find all words
-        def replace_word(match):
-            word = match.group(0)
+        # Split once: words land at odd indices, the text between them at
+        # even ones, so joining the parts back preserves positions
+        parts = self._word_re.split(text)
+
+        for i in range(1, len(parts), 2):
+            word = parts[i]
             corrected, confidence = self.correct_word(word)
 
             if confidence >= threshold and corrected != word:
                 self.corrections_made[(word, corrected)] += 1
-                return corrected
-            return word
+                parts[i] = corrected
 
-        # Replace words while preserving positions
-        return re.sub(r'\b[A-Za-z]+\b', replace_word, text)
+        return ''.join(parts)
 
-    def process_file(self, input_path: str, output_path: str, sample: int = None):
-        """Process JSON file and write corrected version"""
+    def add_corrections(self, corrections_made: Counter):
+        """Merge in corrections_made counts from another copy of this corrector"""
+        self.corrections_made.update(corrections_made)
+
+    def process_file(self, input_path: str, output_path: str, sample: int = None,
+                     workers: int = None):
+        """Process JSON file and write corrected version (workers: processes, default CPU count)"""
         print(f"\n=== Simple OCR Corrector ===")
         print(f"Input: {input_path}")
         print(f"Output: {output_path}\n")
 
         # Load
         print("Loading...")
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(input_path)
 
         pages = data.get('pages', [])
         total_pages = len(pages)
@@ -114,16 +128,16 @@ class SimpleOCRCorrector:
         print("Correcting pages...")
         start_time = time.time()
 
-        for i, page in enumerate(pages):
-            if i % 100 == 0 and i > 0:
-                elapsed = time.time() - start_time
-                rate = i / elapsed
-                eta = (len(pages) - i) / rate
-                print(f"  Page {i}/{len(pages)} ({rate:.1f} pages/sec, ETA: {eta/60:.1f} min)")
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        def progress(i):
+            elapsed = time.time() - start_time
+            rate = i / elapsed
+            eta = (len(pages) - i) / rate
+            print(f"  Page {i}/{len(pages)} ({rate:.1f} pages/sec, ETA: {eta/60:.1f} min)")
 
-            # Correct the markdown
-            if 'markdown' in page:
-                page['markdown'] = self.correct_text(page['markdown'])
+        correct_pages(self, pages, workers, progress)
 
         elapsed = time.time() - start_time
         print(f"\n✓ Processed {len(pages)} pages in {elapsed:.1f}s ({len(pages)/elapsed:.1f} pages/sec)\n")
@@ -143,8 +157,7 @@ class SimpleOCRCorrector:
         # Write
         print(f"\n=== Writing Output ===")
         data['pages'] = pages
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json_indented(output_path, data)
         print(f"✓ Wrote: {output_path}")
 
         # Write report
@@ -157,8 +170,7 @@ class SimpleOCRCorrector:
                 for (orig, corr), count in self.corrections_made.most_common()
             ]
         }
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        write_json_indented(report_path, report)
         print(f"✓ Wrote report: {report_path}")
 
 def main():
@@ -168,11 +180,12 @@ def main():
     parser.add_argument('--input', default='mirror-ocr-11-2-ALL-pages-parsed.json')
     parser.add_argument('--output', default='mirror-ocr-11-2-ALL-pages-corrected.json')
     parser.add_argument('--sample', type=int, help='Process only first N pages')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
 
     args = parser.parse_args()
 
     corrector = SimpleOCRCorrector()
-    corrector.process_file(args.input, args.output, args.sample)
+    corrector.process_file(args.input, args.output, args.sample, args.workers)
 
 if __name__ == '__main__':
     main()
@@ -11,11 +11,16 @@ import os
 import sys
 from collections import Counter, defaultdict
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Set, Tuple, Optional
+from itertools import islice
+from typing import Iterable, List, Dict, Set, Tuple, Optional
 import math
 from pathlib import Path
+from multiprocessing import Pool
 import time
 
+from edit_distance import NATIVE_LEVENSHTEIN, build_deletion_index, find_within
+from json_io import CorpusWriter, PageSource, atomic_open, write_json_indented
+
 # Verbose logging flag
 VERBOSE = os.environ.get('VERBOSE', '0') == '1'
 
@@ -32,25 +37,12 @@ except ImportError:
     enchant = None
 
 try:
-    from Levenshtein import distance as levenshtein_distance
+    import orjson
 except ImportError:
+    orjson = None
+
+if not NATIVE_LEVENSHTEIN:
     print("Warning: python-Levenshtein not installed. Using slower fallback.")
-    def levenshtein_distance(s1: str, s2: str) -> int:
-        """Fallback Levenshtein distance implementation"""
-        if len(s1) < len(s2):
-            return levenshtein_distance(s2, s1)
-        if len(s2) == 0:
-            return len(s1)
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        return previous_row[-1]
 
 
 # ============================================================================
@@ -100,18 +92,17 @@ CONFIG = {
         "bnt": ["but"],
         "tiie": ["the"],
         "tlie": ["the"],
-        "aud": ["and"],
     },
     "edit_distance_threshold": 2,
     "min_ngram_score": -15.0,
     "auto_correct_threshold": 0.90,
-    "preserve_historical_spellings": [
+    "preserve_historical_spellings": frozenset([
         "connexion", "shew", "shewn", "shewed", "pro formâ",
         "portale", "favourable", "colour", "honour",
         "labour", "favour", "endeavour", "neighbour",
         "centre", "theatre", "metre", "travelled", "marvellous",
         "acknowledgement", "judgement"
-    ],
+    ]),
     "structural_patterns": {
         "speaker": r'^(The |LORD |EARL |DUKE |Mr\. |Sir |COLONEL |MAJOR |CAPTAIN )?[A-Z][A-Za-z\s\-]+\.—',
         "house_header": r'^HOUSE OF (LORDS|COMMONS)',
@@ -125,6 +116,12 @@ CONFIG = {
     "websters_1828_url": "https://raw.githubusercontent.com/matthewreagan/WebstersEnglishDictionary/master/dictionary.json"
 }
 
+# Word tokens, as used by the vocabulary builder and page tokenizer
+WORD_RE = re.compile(r'\b[A-Za-z]+\b')
+
+# Roman numeral letters, for check_word
+_ROMAN = frozenset('IVXLCDM')
+
 
 # ============================================================================
 # BOOTSTRAP DATA
@@ -163,7 +160,8 @@ class DataBootstrapper:
             print(f"  Attempting to download from {CONFIG['websters_1828_url']}")
 
             with urllib.request.urlopen(CONFIG['websters_1828_url'], timeout=10) as response:
-                data = json.loads(response.read())
+                body = response.read()
+                data = orjson.loads(body) if orjson is not None else json.loads(body)
 
                 # Extract words
                 words = set()
@@ -191,7 +189,7 @@ class DataBootstrapper:
             "shew", "shewn", "shewed", "connexion", "compleat", "publick",
             "musick", "favour", "honour", "colour", "labour", "neighbour",
             "centre", "theatre", "metre", "travelled", "marvellous",
-            "acknowledgement", "judgement", "connexion"
+            "acknowledgement", "judgement"
         ]
 
         with open(dict_path, 'w', encoding='utf-8') as f:
@@ -213,7 +211,8 @@ class DictionaryChecker:
         self.data_dir = Path(data_dir)
         self.modern_dict = None
         self.historical_words = set()
-        self.preserved_spellings = set(config['preserve_historical_spellings'])
+        # Matched against lowercased words, so lowercase the entries once
+        self.preserved_spellings = frozenset(w.lower() for w in config['preserve_historical_spellings'])
 
         # Common parliamentary terms (curated, not from OCR)
         self.parliamentary_terms = {
@@ -224,10 +223,21 @@ class DictionaryChecker:
             "FEBRUARY", "MARCH", "APRIL", "JANUARY", "DECEMBER"
         }
 
+        # word -> check_word result; the corpus vocabulary is small and
+        # repetitive, so most lookups after the first pages are hits
+        self._check_cache = {}
+        # Lowercase words accepted outright (preserved spellings plus the
+        # historical dictionary), and clean words the modern dictionary
+        # has already accepted, so repeats skip the enchant call
+        self._known_lower = frozenset()
+        self._modern_known = set()
+
         self._load_dictionaries()
 
     def _load_dictionaries(self):
         """Load all dictionaries"""
+        self._check_cache.clear()
+
         # Modern English (via enchant)
         if enchant:
             try:
@@ -247,16 +257,39 @@ class DictionaryChecker:
                 self.historical_words = {line.strip().lower() for line in f if line.strip()}
             print(f"✓ Loaded historical dictionary: {len(self.historical_words)} words")
 
+        self._known_lower = frozenset(self.preserved_spellings | self.historical_words)
+        self._modern_known = set()
+
+    def __getstate__(self):
+        # enchant dictionaries hold a C handle and can't be pickled (for
+        # process_file workers); send the tag and reopen it on arrival
+        state = self.__dict__.copy()
+        state['modern_dict'] = self.modern_dict.tag if self.modern_dict else None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.modern_dict:
+            self.modern_dict = enchant.Dict(self.modern_dict)
+
     def check_word(self, word: str) -> bool:
         """Check if word is valid in any dictionary"""
+        result = self._check_cache.get(word)
+        if result is None:
+            result = self._check_cache[word] = self._check_word(word)
+        return result
+
+    def _check_word(self, word: str) -> bool:
+        """Uncached check_word"""
         if not word or len(word) < 2:
             return True  # Skip very short words
 
         # Remove trailing punctuation
         clean_word = word.rstrip('.,;:!?—')
 
-        # Preserve historical spellings
-        if clean_word.lower() in self.preserved_spellings:
+        # Preserve historical spellings / check historical dictionary
+        clean_lower = clean_word.lower()
+        if clean_lower in self._known_lower:
             return True
 
         # Check parliamentary terms (exact match, case-insensitive for all caps)
@@ -264,24 +297,22 @@ class DictionaryChecker:
             return True
 
         # Check if it's a number or Roman numeral
-        if re.match(r'^\d+$', clean_word) or re.match(r'^[IVXLCDM]+$', clean_word):
+        # (isdecimal accepts exactly the characters \d matches)
+        if clean_word and (clean_word.isdecimal() or _ROMAN.issuperset(clean_word)):
             return True
 
         # Check modern dictionary
         if self.modern_dict:
+            if clean_word in self._modern_known:
+                return True
             try:
-                if self.modern_dict.check(clean_word):
-                    return True
                 # Also check lowercase version
-                if self.modern_dict.check(clean_word.lower()):
+                if self.modern_dict.check(clean_word) or self.modern_dict.check(clean_lower):
+                    self._modern_known.add(clean_word)
                     return True
             except:
                 pass
 
-        # Check historical dictionary
-        if clean_word.lower() in self.historical_words:
-            return True
-
         return False
 
 
@@ -296,21 +327,38 @@ class ConfusionDetector:
         self.confusion_pairs = config['character_confusion_pairs']
         self.dict_checker = dict_checker
 
+        # (wrong, right) pairs, longest wrong pattern first, plus one
+        # alternation that rules out words containing none of them
+        self._sorted_pairs = sorted(
+            ((wrong, right) for wrong, rights in self.confusion_pairs.items() for right in rights),
+            key=lambda pair: -len(pair[0])
+        )
+        self._wrong_re = re.compile('|'.join(re.escape(wrong) for wrong, _ in self._sorted_pairs))
+        self._pattern_cache = {}  # word -> candidates, for find_confusion_patterns
+
     def find_confusion_patterns(self, word: str) -> List[Tuple[str, float]]:
         """Find potential corrections based on character confusion"""
+        candidates = self._pattern_cache.get(word)
+        if candidates is None:
+            candidates = self._pattern_cache[word] = self._find_confusion_patterns(word)
+        return list(candidates)
+
+    def _find_confusion_patterns(self, word: str) -> List[Tuple[str, float]]:
+        """Uncached find_confusion_patterns"""
         candidates = []
+        if not self._wrong_re.search(word):
+            return candidates
 
-        for wrong, rights in self.confusion_pairs.items():
+        for wrong, right in self._sorted_pairs:
             if wrong in word:
-                for right in rights:
-                    # Generate candidate
-                    candidate = word.replace(wrong, right)
+                # Generate candidate
+                candidate = word.replace(wrong, right)
 
-                    # Check if candidate is valid
-                    if candidate != word and self.dict_checker.check_word(candidate):
-                        # Higher confidence for exact case matches
-                        confidence = 0.85 if wrong.isupper() == right.isupper() else 0.75
-                        candidates.append((candidate, confidence))
+                # Check if candidate is valid
+                if candidate != word and self.dict_checker.check_word(candidate):
+                    # Higher confidence for exact case matches
+                    confidence = 0.85 if wrong.isupper() == right.isupper() else 0.75
+                    candidates.append((candidate, confidence))
 
         return candidates
 
@@ -327,14 +375,14 @@ class EntityValidator:
         self.entities = {}
         self.speaker_pattern = re.compile(config['structural_patterns']['speaker'])
 
-    def extract_entities(self, pages: List[dict]):
+    def extract_entities(self, pages: Iterable[dict]):
         """Extract all named entities from corpus - OPTIMIZED"""
         print("Extracting named entities...")
 
         speaker_counts = Counter()
 
         # Limit to first 500 pages for performance
-        sample_pages = pages[:500]
+        sample_pages = islice(pages, 500)
 
         for page in sample_pages:
             markdown = page.get('markdown', '')
@@ -399,20 +447,23 @@ class EditDistanceCorrector:
         self.config = config
         self.dict_checker = dict_checker
         self.ngram_scorer = ngram_scorer
+        self.threshold = config['edit_distance_threshold']
         self.vocabulary = set()
+        # Deletion of a vocabulary word -> vocabulary words (SymSpell index)
+        self.deletes: Dict[str, List[str]] = {}
 
-    def build_vocabulary(self, pages: List[dict]):
+    def build_vocabulary(self, pages: Iterable[dict]):
         """Build limited vocabulary from most common words"""
         print("Building vocabulary for edit distance...")
 
         word_counts = Counter()
 
         # Sample pages to build vocabulary
-        sample_pages = pages[::10]  # Every 10th page
+        sample_pages = islice(pages, 0, None, 10)  # Every 10th page
 
         for page in sample_pages:
             markdown = page.get('markdown', '')
-            words = re.findall(r'\b[A-Za-z]+\b', markdown.lower())
+            words = WORD_RE.findall(markdown.lower())
             word_counts.update(words)
 
         # Keep only top N most common words that appear min_frequency times
@@ -424,46 +475,33 @@ class EditDistanceCorrector:
             if count >= min_freq and self.dict_checker.check_word(word)
         }
 
+        # Indexing the vocabulary's deletions lets generate_corrections find
+        # every word within the threshold without a full scan
+        self.deletes = build_deletion_index(self.vocabulary, self.threshold)
+
         print(f"✓ Built vocabulary: {len(self.vocabulary)} words")
 
     def generate_corrections(self, word: str, context_words: List[str]) -> List[Tuple[str, float]]:
         """Generate correction candidates - OPTIMIZED"""
         candidates = []
-        threshold = self.config['edit_distance_threshold']
+        threshold = self.threshold
         word_lower = word.lower()
 
         # Early exit if word is too short
         if len(word) < 3:
             return []
 
-        checked = 0
-        max_checks = 200  # Limit how many words we check
-
-        # Quick filter: only check words with similar length
-        for vocab_word in self.vocabulary:
-            if checked >= max_checks:
-                break
-
-            # Length filter
-            if abs(len(vocab_word) - len(word)) > threshold:
-                continue
-
-            # First letter filter (allow 1-2 char difference in ASCII)
-            if abs(ord(vocab_word[0]) - ord(word_lower[0])) > 2:
-                continue
-
-            checked += 1
+        check_word = self.dict_checker.check_word
+        # First letter filter (allow 1-2 char difference in ASCII)
+        for vocab_word, dist in find_within(word_lower, self.deletes, threshold, first_letter_window=2):
+            # Simple confidence based on edit distance
+            confidence = 0.5 * (1.0 - (dist / threshold))
 
-            dist = levenshtein_distance(word_lower, vocab_word)
-            if dist <= threshold and dist > 0:
-                # Simple confidence based on edit distance
-                confidence = 0.5 * (1.0 - (dist / threshold))
+            # Bonus if in dictionary
+            if check_word(vocab_word):
+                confidence += 0.3
 
-                # Bonus if in dictionary
-                if self.dict_checker.check_word(vocab_word):
-                    confidence += 0.3
-
-                candidates.append((vocab_word, min(confidence, 1.0)))
+            candidates.append((vocab_word, min(confidence, 1.0)))
 
         # Sort by confidence and return top 3
         candidates.sort(key=lambda x: x[1], reverse=True)
@@ -515,87 +553,136 @@ class OCRCorrector:
     def process_file(self, input_path: str, output_report: str, output_corrected: str):
         """Process OCR file and generate corrections"""
 
-        # Load data
+        # Load data (pages are re-read from the file on each pass when
+        # ijson is installed; see PageSource)
         print(f"\n=== Loading {input_path} ===")
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        all_pages = data.get('pages', [])
+        source = PageSource(input_path)
+        all_pages = source.iter_pages
 
         # Sample pages if requested (but build vocabulary from all pages)
-        if self.config.get('sample_pages'):
-            sample_size = self.config['sample_pages']
-            pages = all_pages[:sample_size]
-            print(f"✓ Loaded {len(all_pages)} pages, processing first {len(pages)} (sample mode)\n")
+        sample_size = self.config.get('sample_pages') or None
+        if source.streaming:
+            # The vocabulary pass below counts the pages
+            print("✓ Streaming pages with ijson\n")
         else:
-            pages = all_pages
-            print(f"✓ Loaded {len(pages)} pages\n")
+            self._print_page_count(source.page_count, sample_size)
 
         # Initialize all components
         print("=== Initializing Components ===")
         self.dict_checker = DictionaryChecker(self.config, self.data_dir)
         self.confusion_detector = ConfusionDetector(self.config, self.dict_checker)
         self.entity_validator = EntityValidator(self.config)
-        self.ngram_scorer = NgramScorer(all_pages, self.config)
+        self.ngram_scorer = NgramScorer(all_pages(), self.config)
         self.edit_corrector = EditDistanceCorrector(self.config, self.dict_checker, self.ngram_scorer)
         self.struct_validator = StructuralValidator(self.config)
 
         # Build vocabulary for edit distance (use ALL pages, even in sample mode)
-        self.edit_corrector.build_vocabulary(all_pages)
+        self.edit_corrector.build_vocabulary(all_pages())
 
         # Extract entities (sampled)
-        self.entity_validator.extract_entities(pages)
+        self.entity_validator.extract_entities(islice(all_pages(), sample_size))
         print()
 
+        if source.streaming:
+            self._print_page_count(source.page_count, sample_size)
+        page_count = min(sample_size or source.page_count, source.page_count)
+
         # Process pages
         print("=== Processing Pages ===")
-        all_errors = []
+
+        # Each page's errors go to the JSONL report, and the corrected page
+        # to the output file, as soon as the page is done; only the counts
+        # behind the statistics stay in memory. Both files replace their
+        # targets only once every page is written.
+        pages = islice(all_pages(), sample_size)
+        workers = self.config.get('workers') or os.cpu_count() or 1
+        with atomic_open(output_report) as report_file, atomic_open(output_corrected) as corrected_out:
+            corrected_file = CorpusWriter(corrected_out, source.fields)
+            if workers > 1:
+                # Pages are independent once the vocabulary and entities are
+                # built: correct them in worker processes (each holding a copy
+                # of this corrector) and take the results back in page order
+                with Pool(workers, initializer=_init_worker, initargs=(self,)) as pool:
+                    results = pool.imap(_correct_page, pages, chunksize=10)
+                    totals = self._write_results(results, page_count, report_file, corrected_file)
+            else:
+                results = map(self._correct_page, pages)
+                totals = self._write_results(results, page_count, report_file, corrected_file)
+            corrected_file.finish()
+        errors_found, errors_by_type, top_errors, corrections_applied = totals
+
+        print(f"✓ Processed {page_count} pages")
+        print(f"✓ Found {errors_found} potential errors")
+        print(f"✓ Auto-applied {corrections_applied} high-confidence corrections\n")
+
+        # Write outputs
+        print("=== Writing Outputs ===")
+        print(f"✓ Wrote corrections report: {output_report}")
+        print(f"✓ Wrote corrected file: {output_corrected}")
+        self._write_statistics(errors_found, errors_by_type, top_errors)
+
+        print("\n=== Complete ===")
+        print(f"Report: {output_report}")
+        print(f"Corrected file: {output_corrected}")
+        print(f"Statistics: ocr-statistics.json")
+
+    def _write_results(self, results: Iterable[Tuple[dict, List[ErrorCandidate], int, float]],
+                       page_count: int, report_file, corrected_file: CorpusWriter
+                       ) -> Tuple[int, Counter, Counter, int]:
+        """
+        Write each corrected page, and its errors, as _correct_page results arrive.
+
+        Returns:
+            (errors_found, errors_by_type, top_errors, corrections_applied)
+        """
+        errors_found = 0
+        errors_by_type = Counter()
+        top_errors = Counter()
         corrections_applied = 0
         start_time = time.time()
 
-        for i, page in enumerate(pages):
-            page_start = time.time()
-
+        for i, (page, page_errors, applied, page_time) in enumerate(results):
             if i % 10 == 0 and i > 0:
                 elapsed = time.time() - start_time
                 rate = i / elapsed
-                eta = (len(pages) - i) / rate if rate > 0 else 0
-                print(f"Processing page {i}/{len(pages)}... "
+                eta = (page_count - i) / rate if rate > 0 else 0
+                print(f"Processing page {i}/{page_count}... "
                       f"({corrections_applied} corrections, "
                       f"{rate:.1f} pages/sec, "
                       f"ETA: {eta/60:.1f} min)")
 
-            page_errors = self._process_page(page)
-            all_errors.extend(page_errors)
-
-            # Auto-apply high-confidence corrections
-            page['markdown'], applied = self._apply_corrections(
-                page['markdown'],
-                page_errors,
-                self.config['auto_correct_threshold']
-            )
+            self._write_report(report_file, page_errors)
+            errors_found += len(page_errors)
+            self._count_errors(page_errors, errors_by_type, top_errors)
+            corrected_file.write_page(page)
             corrections_applied += applied
 
-            page_time = time.time() - page_start
             log(f"Page {i} completed in {page_time:.2f}s, {applied} corrections applied", force=True)
 
-        print(f"✓ Processed {len(pages)} pages")
-        print(f"✓ Found {len(all_errors)} potential errors")
-        print(f"✓ Auto-applied {corrections_applied} high-confidence corrections\n")
-
-        # Write outputs
-        print("=== Writing Outputs ===")
-        self._write_report(all_errors, output_report)
-
-        # Update data with processed pages
-        data['pages'] = pages
-        self._write_corrected(data, output_corrected)
-        self._write_statistics(all_errors)
+        return errors_found, errors_by_type, top_errors, corrections_applied
 
-        print("\n=== Complete ===")
-        print(f"Report: {output_report}")
-        print(f"Corrected file: {output_corrected}")
-        print(f"Statistics: ocr-statistics.json")
+    def _print_page_count(self, total_pages: int, sample_size: Optional[int]):
+        """Report how many pages were loaded and how many will be processed"""
+        if sample_size:
+            print(f"✓ Loaded {total_pages} pages, processing first {min(sample_size, total_pages)} (sample mode)\n")
+        else:
+            print(f"✓ Loaded {total_pages} pages\n")
+
+    def _correct_page(self, page: dict) -> Tuple[dict, List[ErrorCandidate], int, float]:
+        """
+        Find a page's errors and auto-apply the high-confidence ones.
+
+        Returns:
+            (corrected_page, page_errors, corrections_applied, seconds)
+        """
+        page_start = time.time()
+        page_errors = self._process_page(page)
+        page['markdown'], applied = self._apply_corrections(
+            page['markdown'],
+            page_errors,
+            self.config['auto_correct_threshold']
+        )
+        return page, page_errors, applied, time.time() - page_start
 
     def _process_page(self, page: dict) -> List[ErrorCandidate]:
         """Process a single page - OPTIMIZED"""
@@ -612,6 +699,7 @@ class OCRCorrector:
 
         # METHOD 1 + 2: Dictionary check + Confusion patterns
         unknown_words = 0
+        auto_correct_threshold = self.config['auto_correct_threshold']
         t1 = time.time()
 
         for i, (word, pos) in enumerate(words_with_pos):
@@ -636,8 +724,9 @@ class OCRCorrector:
                     error.error_types.append('confusion_pattern')
                     error.suggested_corrections.extend(confusions)
 
-                # METHOD 5: Edit distance for words between 4-12 chars (if no high-confidence confusion match)
-                if len(error.suggested_corrections) == 0 or error.suggested_corrections[0][1] < 0.9:
+                # METHOD 5: Edit distance for words between 4-12 chars (if no
+                # confusion match confident enough to be auto-applied)
+                if len(error.suggested_corrections) == 0 or error.suggested_corrections[0][1] < auto_correct_threshold:
                     if 4 <= len(word) <= 12:
                         context_words = []  # Skip context for speed
                         edit_corrections = self.edit_corrector.generate_corrections(word, context_words)
@@ -655,10 +744,7 @@ class OCRCorrector:
 
     def _tokenize_with_positions(self, text: str) -> List[Tuple[str, int]]:
         """Tokenize text and track positions"""
-        words_with_pos = []
-        for match in re.finditer(r'\b[A-Za-z]+\b', text):
-            words_with_pos.append((match.group(0), match.start()))
-        return words_with_pos
+        return [(match.group(0), match.start()) for match in WORD_RE.finditer(text)]
 
     def _get_context(self, text: str, pos: int, window: int = 50) -> str:
         """Get context around position"""
@@ -668,9 +754,12 @@ class OCRCorrector:
 
     def _apply_corrections(self, text: str, errors: List[ErrorCandidate], threshold: float) -> Tuple[str, int]:
         """Apply high-confidence corrections to text"""
-        # Sort errors by position (reverse order to maintain positions)
-        errors_sorted = sorted(errors, key=lambda e: e.position, reverse=True)
+        # Collect the edits in position order and build the corrected text
+        # in one join, rather than re-slicing the whole page per correction
+        errors_sorted = sorted(errors, key=lambda e: e.position)
 
+        pieces = []
+        cursor = 0
         applied = 0
         for error in errors_sorted:
             if error.suggested_corrections:
@@ -688,57 +777,73 @@ class OCRCorrector:
                         best_correction = best_correction.capitalize()
 
                     # Replace
-                    text = text[:pos] + best_correction + text[pos + word_len:]
+                    pieces.append(text[cursor:pos])
+                    pieces.append(best_correction)
+                    cursor = pos + word_len
                     applied += 1
 
-        return text, applied
+        if not applied:
+            return text, 0
+        pieces.append(text[cursor:])
+        return ''.join(pieces), applied
 
-    def _write_report(self, errors: List[ErrorCandidate], output_path: str):
-        """Write detailed error report"""
-        with open(output_path, 'w', encoding='utf-8') as f:
+    def _write_report(self, report_file, errors: List[ErrorCandidate]):
+        """Append errors to the detailed error report, one compact JSON object per line"""
+        if orjson is not None:
             for error in errors:
-                f.write(json.dumps(error.to_dict()) + '\n')
-        print(f"✓ Wrote corrections report: {output_path}")
-
-    def _write_corrected(self, data: dict, output_path: str):
-        """Write corrected JSON file"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"✓ Wrote corrected file: {output_path}")
-
-    def _write_statistics(self, errors: List[ErrorCandidate]):
-        """Write statistics summary"""
-        stats = {
-            'total_errors_found': len(errors),
-            'errors_by_type': Counter(),
-            'top_errors': Counter(),
-        }
+                report_file.write(orjson.dumps(error.to_dict()) + b'\n')
+        else:
+            # orjson's layout: no spaces after separators, non-ASCII unescaped
+            for error in errors:
+                line = json.dumps(error.to_dict(), ensure_ascii=False, separators=(',', ':'))
+                report_file.write(line.encode('utf-8') + b'\n')
 
+    def _count_errors(self, errors: List[ErrorCandidate], errors_by_type: Counter, top_errors: Counter):
+        """Add errors to the statistics counters"""
         for error in errors:
             for error_type in error.error_types:
-                stats['errors_by_type'][error_type] += 1
+                errors_by_type[error_type] += 1
 
             if error.suggested_corrections:
                 best_correction = error.suggested_corrections[0][0]
-                stats['top_errors'][(error.original_word, best_correction)] += 1
+                top_errors[(error.original_word, best_correction)] += 1
 
+    def _write_statistics(self, errors_found: int, errors_by_type: Counter, top_errors: Counter):
+        """Write statistics summary"""
         # Convert counters to lists
-        stats['errors_by_type'] = dict(stats['errors_by_type'])
+        stats = {
+            'total_errors_found': errors_found,
+            'errors_by_type': dict(errors_by_type),
+        }
         stats['top_errors'] = [
             {
                 'original': orig,
                 'suggested': sugg,
                 'count': count
             }
-            for (orig, sugg), count in stats['top_errors'].most_common(50)
+            for (orig, sugg), count in top_errors.most_common(50)
         ]
 
-        with open('ocr-statistics.json', 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False)
+        write_json_indented('ocr-statistics.json', stats)
 
         print(f"✓ Wrote statistics: ocr-statistics.json")
 
 
+# Per-process corrector for the process_file workers
+_worker_corrector = None
+
+
+def _init_worker(corrector: OCRCorrector):
+    """Pool initializer: keep this worker's copy of the corrector."""
+    global _worker_corrector
+    _worker_corrector = corrector
+
+
+def _correct_page(page: dict) -> Tuple[dict, List[ErrorCandidate], int, float]:
+    """Pool task: find and apply corrections for one page in this worker."""
+    return _worker_corrector._correct_page(page)
+
+
 # ============================================================================
 # MAIN
 # ============================================================================
@@ -782,6 +887,12 @@ def main():
         default=None,
         help='Process only first N pages (for testing)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes (default: CPU count)'
+    )
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -800,6 +911,7 @@ def main():
     CONFIG['auto_correct_threshold'] = args.threshold
     CONFIG['data_dir'] = args.data_dir
     CONFIG['sample_pages'] = args.sample
+    CONFIG['workers'] = args.workers
 
     # Run correction
     corrector = OCRCorrector(CONFIG)
@@ -12,6 +12,11 @@ import re
 from typing import Dict, List, Tuple, Optional
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:
+    Indel = None
+
 
 def fuzzy_match(text: str, target: str, threshold: float = 0.8) -> bool:
     """
@@ -25,8 +30,29 @@ def fuzzy_match(text: str, target: str, threshold: float = 0.8) -> bool:
     Returns:
         True if similarity >= threshold
     """
-    similarity = SequenceMatcher(None, text.upper(), target.upper()).ratio()
-    return similarity >= threshold
+    text = text.upper()
+    target = target.upper()
+    total = len(text) + len(target)
+
+    # The score is always difflib's 2*M/T. rapidfuzz's Indel distance
+    # gives the longest common subsequence, which is never shorter than
+    # the blocks SequenceMatcher matches, so (T - distance)/T bounds the
+    # score from above and rules out most lines without running difflib.
+    if Indel is not None and total and (total - Indel.distance(text, target)) / total < threshold:
+        return False
+    return SequenceMatcher(None, text, target).ratio() >= threshold
+
+
+# Month names (various cases due to OCR)
+MONTH_NAMES = frozenset([
+    'january', 'february', 'march', 'april', 'may', 'june',
+    'july', 'august', 'september', 'october', 'november', 'december',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec',
+])
+
+# Characters allowed after the month in a date header: numbers,
+# punctuation, and I/i/l (common date punctuation and roman numerals)
+DATE_HEADER_CHARS = frozenset('0123456789.,;:°*\' -—IilVXLCDM')
 
 
 def is_date_header(line: str) -> bool:
@@ -42,32 +68,20 @@ def is_date_header(line: str) -> bool:
     """
     line_stripped = line.strip()
 
-    # Month names (various cases due to OCR)
-    months = ['january', 'february', 'march', 'april', 'may', 'june',
-              'july', 'august', 'september', 'october', 'november', 'december',
-              'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-
-    # Check if starts with a month name
-    first_word = line_stripped.split()[0] if line_stripped.split() else ''
-    if first_word.lower() not in months:
+    # Check if starts with a month name (split off the first word only)
+    parts = line_stripped.split(None, 1)
+    first_word = parts[0] if parts else ''
+    if first_word.lower() not in MONTH_NAMES:
         return False
 
     # Get the rest after the month
-    rest = line_stripped[len(first_word):].strip()
-
-    # Should contain only numbers, punctuation, and I/i/l
-    # Allow common date punctuation and roman numerals
-    allowed_chars = set('0123456789.,;:°*\' -—IilVXLCDM')
+    rest = parts[1] if len(parts) > 1 else ''
 
     if not rest:
         return False
 
     # Check if all remaining characters are allowed
-    for char in rest:
-        if char not in allowed_chars:
-            return False
-
-    return True
+    return DATE_HEADER_CHARS.issuperset(rest)
 
 
 def is_parliamentary_house_header(line: str) -> bool:
@@ -300,29 +314,35 @@ def process_json_file(input_path: str, output_path: str):
         print("No pages found in JSON")
         return
 
-    # First pass: Process each page (extract headers, remove footers)
-    processed_pages = [process_page(page) for page in data['pages']]
+    # Single pass: process each page (extract headers, remove footers), then
+    # join hyphenated words across the boundary with the page before it.
+    # The previous page has already been fully processed at that point, so
+    # this matches running the two steps as separate passes.
+    processed_pages = []
+    headers_extracted = 0
 
-    # Second pass: Join hyphenated words across page boundaries
-    for i in range(len(processed_pages) - 1):
-        prev_page = processed_pages[i]
-        curr_page = processed_pages[i + 1]
+    for page in data['pages']:
+        curr_page = process_page(page)
+        if 'header' in curr_page:
+            headers_extracted += 1
 
-        prev_markdown = prev_page.get('markdown', '')
-        curr_markdown = curr_page.get('markdown', '')
+        if processed_pages:
+            prev_page = processed_pages[-1]
 
-        # Join hyphenated words
-        updated_prev, updated_curr = join_hyphenated_words(prev_markdown, curr_markdown)
+            prev_markdown = prev_page.get('markdown', '')
+            curr_markdown = curr_page.get('markdown', '')
 
-        # Update the pages if changes were made
-        if updated_prev != prev_markdown:
-            processed_pages[i]['markdown'] = updated_prev
-            processed_pages[i + 1]['markdown'] = updated_curr
+            # Join hyphenated words
+            updated_prev, updated_curr = join_hyphenated_words(prev_markdown, curr_markdown)
 
-    data['pages'] = processed_pages
+            # Update the pages if changes were made
+            if updated_prev != prev_markdown:
+                prev_page['markdown'] = updated_prev
+                curr_page['markdown'] = updated_curr
 
-    # Count statistics
-    headers_extracted = sum(1 for p in processed_pages if 'header' in p)
+        processed_pages.append(curr_page)
+
+    data['pages'] = processed_pages
 
     # Write output file
     with open(output_path, 'w', encoding='utf-8') as f:
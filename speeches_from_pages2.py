@@ -1,8 +1,14 @@
 import json
 import re
 import difflib
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --------------------------------------------------------------------
 # Configuration
 # --------------------------------------------------------------------
@@ -61,6 +67,8 @@ LATIN_MONTHS = {
     "DECEMBRIS": 12,
 }
 
+LATIN_MONTH_KEYS = list(LATIN_MONTHS.keys())
+
 
 def detect_simple_house(paragraph: str):
     """
@@ -121,12 +129,14 @@ def parse_latin_date_line(text: str):
     if not month_token:
         return None
 
-    canonical_keys = list(LATIN_MONTHS.keys())
-    match = difflib.get_close_matches(month_token, canonical_keys, n=1, cutoff=0.5)
-    if not match:
-        return None
-
-    month = LATIN_MONTHS[match[0]]
+    # Most headings spell the month correctly; only fall back to the
+    # fuzzy scan over all twelve months when the direct lookup misses.
+    month = LATIN_MONTHS.get(month_token)
+    if month is None:
+        match = difflib.get_close_matches(month_token, LATIN_MONTH_KEYS, n=1, cutoff=0.5)
+        if not match:
+            return None
+        month = LATIN_MONTHS[match[0]]
     return f"{year:04d}-{month:02d}-{day:02d}"
 
 
@@ -265,10 +275,16 @@ SIMPLE_NAME_AT_START_RE = re.compile(
 )
 
 
+TRAILING_PUNCT_RE = re.compile(r"[,\.;:]+$")
+
+
+# Speaker labels repeat across thousands of paragraphs, so the label
+# helpers below are memoised.
+@lru_cache(maxsize=8192)
 def normalise_speaker_label(raw: str) -> str:
     speaker = raw.strip()
     # Strip trailing punctuation clusters and re-add a single full stop
-    speaker = re.sub(r"[,\.;:]+$", "", speaker).strip()
+    speaker = TRAILING_PUNCT_RE.sub("", speaker).strip()
     if not speaker.endswith("."):
         speaker = speaker + "."
     return speaker
@@ -418,6 +434,7 @@ GENERIC_NON_SPEAKERS_PREFIXES = (
     "THE BILL BEFORE THE HOUSE",
 )
 
+@lru_cache(maxsize=8192)
 def is_generic_non_speaker(label: str) -> bool:
     """
     Filter out phrases we know are NOT intended as speaker labels,
@@ -426,6 +443,53 @@ def is_generic_non_speaker(label: str) -> bool:
     up = label.upper().strip().rstrip(".:;—-")
     return any(up.startswith(p) for p in GENERIC_NON_SPEAKERS_PREFIXES)
 
+# Speaker patterns used by detect_speaker, compiled once at import.
+
+# 1) Patterns like "Mr. O'CONNELL.—", "An HONOURABLE MEMBER.—", etc.
+DASH_SPEAKER_RE = re.compile(
+    r"^("                                     # start of label
+    r"(?:Mr|MR|Mrs|MRS|Miss|MISS|Ms|MS|Dr|DR"
+    r"|Sir|SIR|Lord|LORD|Lady|LADY"
+    r"|Colonel|COLONEL|Major|MAJOR|Captain|CAPTAIN"
+    r"|Viscount|VISCOUNT|Earl|EARL|Duke|DUKE|Marquess|MARQUESS"
+    r"|The\s+LORD\s+CHANCELLOR"
+    r"|The\s+CHANCELLOR\s+of\s+the\s+EXCHEQUER"
+    r"|The\s+ATTORNEY\s+GENERAL"
+    r"|The\s+SOLICITOR\s+GENERAL"
+    r"|An?\s+HONOURABLE\s+MEMBER(?:\s+for\s+[A-Z][A-Za-z'\-]+)?"
+    r"|Several\s+Honourable\s+Members"
+    r"|Several\s+Irish\s+Members\s+together"
+    r"|Many\s+Honourable\s+Members"
+    r"|[A-Z][A-Z\s\.'-]+)"
+    r")\s*[–—\-]\s"                           # dash after label
+)
+
+# 2) Patterns like "Mr. O'CONNELL moved ...", "Dr. LUSHINGTON presented ..."
+NOTIF_SPEAKER_RE = re.compile(
+    r"^("                                     # label
+    r"(?:Mr|MR|Mrs|MRS|Miss|MISS|Ms|MS|Dr|DR"
+    r"|Sir|SIR|Lord|LORD|Lady|LADY"
+    r"|Colonel|COLONEL|Major|MAJOR|Captain|CAPTAIN"
+    r"|Viscount|VISCOUNT|Earl|EARL|Duke|DUKE|Marquess|MARQUESS"
+    r"|The\s+MARQUESS\s+of\s+[A-Z][A-Za-z'-]+"
+    r"|The\s+EARL\s+of\s+[A-Z][A-Za-z'-]+"
+    r"|The\s+DUKE\s+of\s+[A-Z][A-Za-z'-]+"
+    r"|The\s+LORD\s+CHANCELLOR"
+    r"|The\s+CHANCELLOR\s+of\s+the\s+EXCHEQUER"
+    r")(?:\s+[A-Z][A-Za-z\.'-]+)*"            # optional extra surname(s)
+    r")\s+"
+    r"(presented|brought\s+up|brought\s+in|gave\s+notice"
+    r"|then\s+gave\s+notice|moved|rose\s+to\s+move)\b",
+    re.IGNORECASE,
+)
+
+# 3) Simple "Mr. NAME ..." / "Dr. NAME ..." without dash or verb pattern
+SIMPLE_SPEAKER_RE = re.compile(
+    r"^((?:Mr|MR|Mrs|MRS|Miss|MISS|Ms|MS|Dr|DR"
+    r"|Sir|SIR|Lord|LORD|Lady|LADY"
+    r"|Colonel|COLONEL|Major|MAJOR|Captain|CAPTAIN)\.?\s+[A-Z][A-Za-z\.'-]+)"
+)
+
 def detect_speaker(paragraph: str):
     """
     Try to extract a speaker name / label from the start of a paragraph.
@@ -435,60 +499,21 @@ def detect_speaker(paragraph: str):
     first_line = text.split("\n", 1)[0].strip()
 
     # 1) Patterns like "Mr. O'CONNELL.—", "An HONOURABLE MEMBER.—", etc.
-    dash_pattern = re.compile(
-        r"^("                                     # start of label
-        r"(?:Mr|MR|Mrs|MRS|Miss|MISS|Ms|MS|Dr|DR"
-        r"|Sir|SIR|Lord|LORD|Lady|LADY"
-        r"|Colonel|COLONEL|Major|MAJOR|Captain|CAPTAIN"
-        r"|Viscount|VISCOUNT|Earl|EARL|Duke|DUKE|Marquess|MARQUESS"
-        r"|The\s+LORD\s+CHANCELLOR"
-        r"|The\s+CHANCELLOR\s+of\s+the\s+EXCHEQUER"
-        r"|The\s+ATTORNEY\s+GENERAL"
-        r"|The\s+SOLICITOR\s+GENERAL"
-        r"|An?\s+HONOURABLE\s+MEMBER(?:\s+for\s+[A-Z][A-Za-z'\-]+)?"
-        r"|Several\s+Honourable\s+Members"
-        r"|Several\s+Irish\s+Members\s+together"
-        r"|Many\s+Honourable\s+Members"
-        r"|[A-Z][A-Z\s\.'-]+)"
-        r")\s*[–—\-]\s"                           # dash after label
-    )
-    m = dash_pattern.match(first_line)
+    m = DASH_SPEAKER_RE.match(first_line)
     if m:
         label = m.group(1).strip().rstrip(".,;:—-")
         if not is_generic_non_speaker(label):
             return label
 
     # 2) Patterns like "Mr. O'CONNELL moved ...", "Dr. LUSHINGTON presented ..."
-    notif_pattern = re.compile(
-        r"^("                                     # label
-        r"(?:Mr|MR|Mrs|MRS|Miss|MISS|Ms|MS|Dr|DR"
-        r"|Sir|SIR|Lord|LORD|Lady|LADY"
-        r"|Colonel|COLONEL|Major|MAJOR|Captain|CAPTAIN"
-        r"|Viscount|VISCOUNT|Earl|EARL|Duke|DUKE|Marquess|MARQUESS"
-        r"|The\s+MARQUESS\s+of\s+[A-Z][A-Za-z'-]+"
-        r"|The\s+EARL\s+of\s+[A-Z][A-Za-z'-]+"
-        r"|The\s+DUKE\s+of\s+[A-Z][A-Za-z'-]+"
-        r"|The\s+LORD\s+CHANCELLOR"
-        r"|The\s+CHANCELLOR\s+of\s+the\s+EXCHEQUER"
-        r")(?:\s+[A-Z][A-Za-z\.'-]+)*"            # optional extra surname(s)
-        r")\s+"
-        r"(presented|brought\s+up|brought\s+in|gave\s+notice"
-        r"|then\s+gave\s+notice|moved|rose\s+to\s+move)\b",
-        re.IGNORECASE,
-    )
-    m = notif_pattern.match(first_line)
+    m = NOTIF_SPEAKER_RE.match(first_line)
     if m:
         label = m.group(1).strip().rstrip(".,;:—-")
         if not is_generic_non_speaker(label):
             return label
 
     # 3) Simple "Mr. NAME ..." / "Dr. NAME ..." without dash or verb pattern
-    simple_name_pattern = re.compile(
-        r"^((?:Mr|MR|Mrs|MRS|Miss|MISS|Ms|MS|Dr|DR"
-        r"|Sir|SIR|Lord|LORD|Lady|LADY"
-        r"|Colonel|COLONEL|Major|MAJOR|Captain|CAPTAIN)\.?\s+[A-Z][A-Za-z\.'-]+)"
-    )
-    m = simple_name_pattern.match(first_line)
+    m = SIMPLE_SPEAKER_RE.match(first_line)
     if m:
         label = m.group(1).strip().rstrip(".,;:—-")
         if not is_generic_non_speaker(label):
@@ -529,8 +554,12 @@ def split_paragraph_into_speeches(paragraph: str):
 
 
 def load_pages(path: Path):
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    # orjson parses the ~30MB page file several times faster than json
+    if orjson is not None:
+        data = orjson.loads(path.read_bytes())
+    else:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
 
     if isinstance(data, dict) and "pages" in data:
         pages = data["pages"]
@@ -544,7 +573,8 @@ def load_pages(path: Path):
 
 def speeches_from_pages(pages):
     """
-    Turn page-level OCR pages into a list of speech dicts.
+    Turn page-level OCR pages into speech dicts, yielded one at a time
+    as each speech is closed so callers can stream them straight to disk.
 
     Each speech dict contains:
       - house
@@ -555,8 +585,6 @@ def speeches_from_pages(pages):
       - pages (set of page indices)
       - text
     """
-    speeches = []
-
     current_house = None
     current_date_raw = None
     current_date_iso = None
@@ -565,10 +593,9 @@ def speeches_from_pages(pages):
     current_speech = None  # dict with metadata + text + pages(set)
 
     def start_new_speech(speaker, page_index):
+        """Open a new speech; returns the previous one if it should be emitted."""
         nonlocal current_speech
-        # flush the previous speech, if any
-        if current_speech and current_speech["text"].strip():
-            speeches.append(current_speech)
+        finished = current_speech
         current_speech = {
             "house": current_house,
             "date_raw": current_date_raw,
@@ -578,6 +605,10 @@ def speeches_from_pages(pages):
             "pages": set([page_index]),
             "text": "",
         }
+        # flush the previous speech, if any
+        if finished and finished["text"].strip():
+            return finished
+        return None
 
     def append_to_current_speech(text_fragment, page_index):
         nonlocal current_speech
@@ -614,7 +645,7 @@ def speeches_from_pages(pages):
             house2, date_raw2, date_iso2 = detect_latin_house_and_date(p)
             if house2 or date_raw2 or date_iso2:
                 if current_speech and current_speech["text"].strip():
-                    speeches.append(current_speech)
+                    yield current_speech
                 current_speech = None
 
                 if house2:
@@ -630,7 +661,7 @@ def speeches_from_pages(pages):
             house = detect_simple_house(p)
             if house:
                 if current_speech and current_speech["text"].strip():
-                    speeches.append(current_speech)
+                    yield current_speech
                 current_speech = None
                 current_house = house
                 continue
@@ -645,7 +676,9 @@ def speeches_from_pages(pages):
             chunks = split_paragraph_into_speeches(p)
             if chunks:
                 for speaker, content in chunks:
-                    start_new_speech(speaker, page_index)
+                    finished = start_new_speech(speaker, page_index)
+                    if finished:
+                        yield finished
                     append_to_current_speech(content, page_index)
                 continue  # paragraph fully handled
 
@@ -658,7 +691,9 @@ def speeches_from_pages(pages):
                 speaker = None
 
             if speaker:
-                start_new_speech(speaker, page_index)
+                finished = start_new_speech(speaker, page_index)
+                if finished:
+                    yield finished
                 # Strip the heading + dash from the paragraph before appending
                 # so we don't duplicate the label in the text.
                 # We can reuse the regex here.
@@ -674,12 +709,15 @@ def speeches_from_pages(pages):
 
     # Flush final speech
     if current_speech and current_speech["text"].strip():
-        speeches.append(current_speech)
-
-    return speeches
+        yield current_speech
 
 
 def write_speeches_jsonl(speeches, path: Path):
+    """
+    Write speeches (any iterable, including the speeches_from_pages
+    generator) to JSONL. Returns the number of speeches written.
+    """
+    count = 0
     with path.open("w", encoding="utf-8") as f:
         for i, sp in enumerate(speeches, start=1):
             record = {
@@ -692,6 +730,9 @@ def write_speeches_jsonl(speeches, path: Path):
                 "text": sp["text"],
             }
             f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count = i
+
+    return count
 
 
 def main():
@@ -702,12 +743,11 @@ def main():
     pages = load_pages(in_path)
     print(f"Loaded {len(pages)} pages")
 
-    print("Extracting speeches …")
-    speeches = speeches_from_pages(pages)
-    print(f"Extracted {len(speeches)} candidate speeches")
-
-    print(f"Writing JSONL to {out_path} …")
-    write_speeches_jsonl(speeches, out_path)
+    # Speeches are extracted and written in one streaming pass, so the
+    # full list is never held in memory.
+    print(f"Extracting speeches and writing JSONL to {out_path} …")
+    count = write_speeches_jsonl(speeches_from_pages(pages), out_path)
+    print(f"Extracted {count} candidate speeches")
 
     print("Done.")
 